@@ -6,6 +6,7 @@ Description:
 """
 
 from collections.abc import Sequence
+from datetime import datetime
 
 import pytest
 from pydantic import ValidationError
@@ -228,6 +229,30 @@ class TestCustomer(TestSetup):
             for c in result
         )
 
+    def test_bulk_create_customers(self) -> None:
+        """Bulk creating customers from mappings."""
+        result: Message = self.customer_view.bulk_create(
+            db_session=self.session,
+            records=[
+                self.test_customer_1.model_dump(),
+                self.test_customer_2.model_dump(),
+            ],
+        )
+
+        assert result.message == "Records created successfully"
+
+        # Verify customers are created with default timestamps
+        customers: PaginationBase[Customer] = self.customer_view.read_all(
+            db_session=self.session
+        )
+
+        assert customers.total_records == 2
+        assert all(c.created_at is not None for c in customers.records)
+        assert [c.name for c in customers.records] == [
+            self.test_customer_1.name,
+            self.test_customer_2.name,
+        ]
+
     def test_read_customer_by_id(self) -> None:
         """Retrieving a customer by ID."""
         customer: Customer = self.customer_view.create(
@@ -357,6 +382,76 @@ class TestCustomer(TestSetup):
         assert all(c.email != customer_1.email for c in page2_result.records)
         assert all(c.email != customer_2.email for c in page2_result.records)
 
+    def test_read_all_customers_pagination_after_delete(self) -> None:
+        """Customer pagination when record IDs are not contiguous."""
+        customer_1: Customer = self.customer_view.create(
+            db_session=self.session,
+            record=Customer(**self.test_customer_1.model_dump()),
+        )
+        customer_2: Customer = self.customer_view.create(
+            db_session=self.session,
+            record=Customer(**self.test_customer_2.model_dump()),
+        )
+        customer_3: Customer = self.customer_view.create(
+            db_session=self.session,
+            record=Customer(**self.test_customer_3.model_dump()),
+        )
+
+        # Remove first customer so IDs start after a gap
+        self.customer_view.delete_by_id(
+            db_session=self.session, record_id=customer_1.id
+        )
+
+        page1_result: PaginationBase[Customer] = self.customer_view.read_all(
+            db_session=self.session, page=1, limit=1
+        )
+        page2_result: PaginationBase[Customer] = self.customer_view.read_all(
+            db_session=self.session, page=2, limit=1
+        )
+
+        assert page1_result.total_records == 2
+        assert [c.id for c in page1_result.records] == [customer_2.id]
+        assert [c.id for c in page2_result.records] == [customer_3.id]
+
+        # Verify cursors point at existing neighbouring records
+        assert page1_result.next_record_id == customer_3.id
+        assert page1_result.previous_record_id is None
+        assert page2_result.next_record_id is None
+        assert page2_result.previous_record_id == customer_2.id
+
+    def test_read_customers_page(self) -> None:
+        """Retrieving a window of customers by offset and limit."""
+        customers: Sequence[Customer] = self.customer_view.create_multiple(
+            db_session=self.session,
+            records=[
+                Customer(**self.test_customer_1.model_dump()),
+                Customer(**self.test_customer_2.model_dump()),
+                Customer(**self.test_customer_3.model_dump()),
+            ],
+        )
+        ids: list[int] = sorted(c.id for c in customers)
+
+        first_page: Sequence[Customer] = self.customer_view.read_page(
+            db_session=self.session, offset=0, limit=2
+        )
+        second_page: Sequence[Customer] = self.customer_view.read_page(
+            db_session=self.session, offset=2, limit=2
+        )
+        empty_page: Sequence[Customer] = self.customer_view.read_page(
+            db_session=self.session, offset=3, limit=2
+        )
+
+        assert [c.id for c in first_page] == ids[:2]
+        assert [c.id for c in second_page] == ids[2:]
+        assert len(empty_page) == 0
+
+        # Negative limit must not fetch whole table
+        negative_limit_page: Sequence[Customer] = self.customer_view.read_page(
+            db_session=self.session, offset=0, limit=-1
+        )
+
+        assert len(negative_limit_page) == 0
+
     def test_search_customer_by_email(self) -> None:
         """Searching customers by email."""
         # Create test customers
@@ -408,6 +503,22 @@ class TestCustomer(TestSetup):
 
         assert "Invalid search column" in str(exc_info.value)
 
+    def test_search_customer_by_relationship(self) -> None:
+        """Search customer by relationship name instead of a column."""
+        self.customer_view.create(
+            db_session=self.session,
+            record=Customer(**self.test_customer_1.model_dump()),
+        )
+
+        with pytest.raises(ValueError) as exc_info:
+            self.customer_view.read_all(
+                db_session=self.session,
+                search_by="vehicles",
+                search_query="Test",
+            )
+
+        assert "Invalid search column" in str(exc_info.value)
+
     def test_update_customer(self) -> None:
         """Updating a customer."""
         customer: Customer = self.customer_view.create(
@@ -425,6 +536,43 @@ class TestCustomer(TestSetup):
         assert result.id == customer.id
         assert result.model_dump() == customer.model_dump()
 
+    def test_update_customer_partial(self) -> None:
+        """Updating only some fields of a customer."""
+        customer: Customer = self.customer_view.create(
+            db_session=self.session,
+            record=Customer(**self.test_customer_1.model_dump()),
+        )
+
+        result: Customer | None = self.customer_view.update_by_id(
+            db_session=self.session,
+            record_id=customer.id,
+            record=Customer(name="Updated Name"),
+        )
+
+        assert result is not None
+        assert result.name == "Updated Name"
+        assert result.email == self.test_customer_1.email
+        assert result.contact_no == self.test_customer_1.contact_no
+        assert result.updated_at is not None
+
+    def test_update_customer_sets_current_timestamp(self) -> None:
+        """Updating a customer stamps time of update."""
+        customer: Customer = self.customer_view.create(
+            db_session=self.session,
+            record=Customer(**self.test_customer_1.model_dump()),
+        )
+        created_at: datetime = customer.created_at
+
+        result: Customer | None = self.customer_view.update_by_id(
+            db_session=self.session,
+            record_id=customer.id,
+            record=Customer(name="Updated Name"),
+        )
+
+        assert result is not None
+        assert result.updated_at is not None
+        assert result.updated_at >= created_at
+
     def test_update_non_existent_customer(self) -> None:
         """Updating a non-existent customer."""
         non_existent_id: int = -1
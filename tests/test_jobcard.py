@@ -11,6 +11,7 @@ from datetime import date, timedelta
 import pytest
 from pydantic import ValidationError
 from pydantic_extra_types.phone_numbers import PhoneNumber
+from sqlalchemy.orm import joinedload
 from sqlmodel import col, select
 
 from tests.conftest import TestSetup
@@ -717,6 +718,28 @@ class TestJobCard(TestSetup):
             )
         )
 
+    def test_read_jobcard_by_id_with_vehicle(self) -> None:
+        """Retrieving a job card with its vehicle by ID."""
+        jobcard: JobCard = self.jobcard_view.create(
+            db_session=self.session,
+            record=JobCard(
+                **self.test_jobcard_1.model_dump(),
+                inventories=[self.test_inventory_1],
+            ),
+        )
+        vehicle_id: int = jobcard.vehicle_id
+        self.session.expunge_all()
+
+        result: JobCard | None = self.jobcard_view.read_by_id(
+            db_session=self.session,
+            record_id=jobcard.id,
+            options=[joinedload(JobCard.vehicle)],  # type: ignore
+        )
+
+        assert result is not None
+        assert "vehicle" in result.__dict__
+        assert result.vehicle.id == vehicle_id
+
     def test_read_non_existent_jobcard(self) -> None:
         """Retrieving a non-existent job card."""
         non_existent_id: int = -1
@@ -1704,6 +1727,50 @@ class TestJobCard(TestSetup):
             )
         )
 
+    def test_update_multiple_jobcards_repeated_id(self) -> None:
+        """Updating same job card twice in one batch."""
+        jobcard: JobCard = self.jobcard_view.create(
+            db_session=self.session,
+            record=JobCard(
+                **self.test_jobcard_1.model_dump(),
+                inventories=[self.test_inventory_1],
+            ),
+        )
+
+        # Add same new inventory in both passes
+        updated_result: Sequence[JobCard] = (
+            self.jobcard_view.update_multiple_by_ids(
+                db_session=self.session,
+                record_ids=[jobcard.id, jobcard.id],
+                records=[
+                    JobCard(
+                        **self.test_jobcard_1.model_dump(),
+                        inventories=[self.test_inventory_2],
+                    ),
+                    JobCard(
+                        **self.test_jobcard_1.model_dump(),
+                        inventories=[self.test_inventory_2],
+                    ),
+                ],
+            )
+        )
+
+        assert len(updated_result) == 2
+        assert all(j.id == jobcard.id for j in updated_result)
+
+        # Verify single link to new inventory
+        inventory_jobcard_links: Sequence[InventoryJobCardLink] = (
+            self.session.exec(
+                statement=select(InventoryJobCardLink).filter_by(
+                    jobcard_id=jobcard.id
+                )
+            )
+        ).all()
+
+        assert [link.inventory_id for link in inventory_jobcard_links] == [
+            self.test_inventory_2.id
+        ]
+
     def test_delete_jobcard(self) -> None:
         """Deleting a job card."""
         # Set inventory quantity
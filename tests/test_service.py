@@ -11,6 +11,7 @@ from datetime import date, timedelta
 import pytest
 from pydantic import ValidationError
 from pydantic_extra_types.phone_numbers import PhoneNumber
+from sqlalchemy.orm import joinedload
 from sqlmodel import col, select
 
 from tests.conftest import TestSetup
@@ -735,6 +736,28 @@ class TestService(TestSetup):
             )
         )
 
+    def test_read_service_by_id_with_vehicle(self) -> None:
+        """Retrieving a service with its vehicle by ID."""
+        service: Service = self.service_view.create(
+            db_session=self.session,
+            record=Service(
+                **self.test_service_1.model_dump(),
+                inventories=[self.test_inventory_1],
+            ),
+        )
+        vehicle_id: int = service.vehicle_id
+        self.session.expunge_all()
+
+        result: Service | None = self.service_view.read_by_id(
+            db_session=self.session,
+            record_id=service.id,
+            options=[joinedload(Service.vehicle)],  # type: ignore
+        )
+
+        assert result is not None
+        assert "vehicle" in result.__dict__
+        assert result.vehicle.id == vehicle_id
+
     def test_read_non_existent_service(self) -> None:
         """Retrieving a non-existent service."""
         non_existent_id: int = -1
@@ -1866,6 +1889,79 @@ class TestService(TestSetup):
             == initial_quantity_2
         )
 
+    def test_update_multiple_services_repeated_id(self) -> None:
+        """Updating same service twice in one batch."""
+        # Set inventory quantity
+        initial_quantity_1: int = self.test_inventory_1.quantity
+        initial_quantity_2: int = self.test_inventory_2.quantity
+        self.test_inventory_1._service_quantity = 10
+        self.test_inventory_2._service_quantity = 20
+
+        service: Service = self.service_view.create(
+            db_session=self.session,
+            record=Service(
+                **self.test_service_1.model_dump(),
+                inventories=[self.test_inventory_1],
+            ),
+        )
+
+        # Swap inventory in first pass, swap it back in second pass
+        self.test_inventory_1._service_quantity = 5
+        updated_result: Sequence[Service] = (
+            self.service_view.update_multiple_by_ids(
+                db_session=self.session,
+                record_ids=[service.id, service.id],
+                records=[
+                    Service(
+                        **self.test_service_1.model_dump(),
+                        inventories=[self.test_inventory_2],
+                    ),
+                    Service(
+                        **self.test_service_1.model_dump(),
+                        inventories=[self.test_inventory_1],
+                    ),
+                ],
+            )
+        )
+
+        assert len(updated_result) == 2
+        assert all(s.id == service.id for s in updated_result)
+
+        # Verify only last pass is reflected in links
+        inventory_service_links: Sequence[InventoryServiceLink] = (
+            self.session.exec(
+                statement=select(InventoryServiceLink).filter_by(
+                    service_id=service.id
+                )
+            )
+        ).all()
+
+        assert [
+            (link.inventory_id, link.quantity)
+            for link in inventory_service_links
+        ] == [(self.test_inventory_1.id, 5)]
+
+        # Verify inventory quantities
+        db_inventories: dict[int, Inventory] = {
+            inventory.id: inventory
+            for inventory in self.inventory_view.read_multiple_by_ids(
+                db_session=self.session,
+                record_ids=[
+                    self.test_inventory_1.id,
+                    self.test_inventory_2.id,
+                ],
+            )
+        }
+
+        assert (
+            db_inventories[self.test_inventory_1.id].quantity
+            == initial_quantity_1 - 5
+        )
+        assert (
+            db_inventories[self.test_inventory_2.id].quantity
+            == initial_quantity_2
+        )
+
     def test_delete_service(self) -> None:
         """Deleting a service."""
         # Set inventory quantity
@@ -2074,3 +2170,56 @@ class TestService(TestSetup):
         assert len(updated_db_inventories) == 2
         assert updated_db_inventories[0].quantity == initial_quantity_1
         assert updated_db_inventories[1].quantity == initial_quantity_2
+
+    def test_delete_multiple_services_sharing_inventory(self) -> None:
+        """Deleting multiple services that use same inventory item."""
+        # Set inventory quantity
+        initial_quantity: int = self.test_inventory_1.quantity
+        self.test_inventory_1._service_quantity = 10
+
+        # Create services sharing same inventory item
+        services: Sequence[Service] = self.service_view.create_multiple(
+            db_session=self.session,
+            records=[
+                Service(
+                    **self.test_service_1.model_dump(),
+                    inventories=[self.test_inventory_1],
+                ),
+                Service(
+                    **self.test_service_2.model_dump(),
+                    inventories=[self.test_inventory_1],
+                ),
+            ],
+        )
+
+        db_inventory: Inventory | None = self.inventory_view.read_by_id(
+            db_session=self.session, record_id=self.test_inventory_1.id
+        )
+
+        assert db_inventory is not None
+        assert db_inventory.quantity == initial_quantity - 20
+
+        # Delete both services
+        result: Message = self.service_view.delete_multiple_by_ids(
+            db_session=self.session,
+            record_ids=[service.id for service in services],
+        )
+
+        assert result == Message(message="Records deleted successfully")
+
+        # Verify both restorations are applied to inventory
+        self.session.refresh(instance=db_inventory)
+        assert db_inventory.quantity == initial_quantity
+
+        # Verify inventory-service links are removed with services
+        inventory_service_links: Sequence[InventoryServiceLink] = (
+            self.session.exec(
+                statement=select(InventoryServiceLink).where(
+                    col(column_expression=InventoryServiceLink.service_id).in_(
+                        other=[service.id for service in services]
+                    )
+                )
+            )
+        ).all()
+
+        assert inventory_service_links == []
@@ -11,6 +11,7 @@ import pytest
 from pydantic import ValidationError
 from pydantic_extra_types.phone_numbers import PhoneNumber
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import joinedload
 
 from tests.conftest import TestSetup
 from workshop_management_system.v1.base.model import Message, PaginationBase
@@ -202,6 +203,25 @@ class TestVehicle(TestSetup):
         assert vehicle.model_dump() == result.model_dump()
         assert result.customer == self.test_customer_1
 
+    def test_read_vehicle_by_id_with_customer(self) -> None:
+        """Retrieving a vehicle with its customer by ID."""
+        vehicle: Vehicle = self.vehicle_view.create(
+            db_session=self.session,
+            record=Vehicle(**self.test_vehicle_1.model_dump()),
+        )
+        customer_id: int = vehicle.customer_id
+        self.session.expunge_all()
+
+        result: Vehicle | None = self.vehicle_view.read_by_id(
+            db_session=self.session,
+            record_id=vehicle.id,
+            options=[joinedload(Vehicle.customer)],  # type: ignore
+        )
+
+        assert result is not None
+        assert "customer" in result.__dict__
+        assert result.customer.id == customer_id
+
     def test_read_non_existent_vehicle(self) -> None:
         """Retrieving a non-existent vehicle."""
         non_existent_id: int = -1
@@ -7,8 +7,10 @@ for all tables.
 """
 
 from datetime import UTC, datetime
+from sqlite3 import Connection
 
-from sqlalchemy import Engine
+from sqlalchemy import Engine, event
+from sqlalchemy.pool import ConnectionPoolEntry
 from sqlmodel import Field, MetaData, SQLModel, create_engine
 
 from workshop_management_system.core.config import DATABASE_URL
@@ -17,6 +19,34 @@ engine: Engine = create_engine(url=DATABASE_URL)
 my_metadata: MetaData = MetaData()
 
 
+@event.listens_for(target=engine, identifier="connect")
+def set_sqlite_pragma(
+    dbapi_connection: Connection, _connection_record: ConnectionPoolEntry
+) -> None:
+    """Set SQLite pragmas on each new connection.
+
+    Description:
+    - WAL journal with `synchronous=NORMAL` avoids an fsync per commit and
+    keeps readers from blocking writer.
+
+    :Args:
+    - `dbapi_connection` (Connection): Raw DBAPI connection. **(Required)**
+    - `_connection_record` (ConnectionPoolEntry): Pool entry for connection.
+    **(Required)**
+
+    :Returns:
+    - `None`
+
+    """
+    if engine.dialect.name != "sqlite":
+        return
+
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.close()
+
+
 class Base(SQLModel):
     """Base Table.
 
@@ -33,7 +63,8 @@ class Base(SQLModel):
     id: int = Field(primary_key=True)
     created_at: datetime = Field(default_factory=lambda: datetime.now(tz=UTC))
     updated_at: datetime | None = Field(
-        default=None, sa_column_kwargs={"onupdate": datetime.now(tz=UTC)}
+        default=None,
+        sa_column_kwargs={"onupdate": lambda: datetime.now(tz=UTC)},
     )
 
     class ModelConfig:  # pylint: disable=too-few-public-methods
@@ -6,10 +6,11 @@ Description:
 """
 
 from collections.abc import Sequence
-from typing import Generic
+from typing import Any, Generic
 
-from sqlalchemy import ColumnElement
-from sqlmodel import Session, col, func, select
+from sqlalchemy import ColumnElement, bindparam, insert
+from sqlalchemy.orm.interfaces import ORMOption
+from sqlmodel import Session, col, func, select, update
 from sqlmodel.sql._expression_select_cls import SelectOfScalar
 
 from .model import Message, Model, PaginationBase
@@ -34,6 +35,16 @@ class BaseView(Generic[Model]):
 
         """
         self.model: type[Model] = model
+        self.search_columns: frozenset[str] = frozenset(
+            self.model.__table__.columns.keys()  # type: ignore
+        )
+        self.read_by_ids_query: SelectOfScalar[Model] = select(
+            self.model
+        ).where(
+            col(column_expression=self.model.id).in_(
+                other=bindparam(key="record_ids", expanding=True)
+            )
+        )
 
     def create(self, db_session: Session, record: Model) -> Model:
         """Create a new record in database.
@@ -72,18 +83,27 @@ class BaseView(Generic[Model]):
 
         return records
 
-    def read_by_id(self, db_session: Session, record_id: int) -> Model | None:
+    def read_by_id(
+        self,
+        db_session: Session,
+        record_id: int,
+        options: Sequence[ORMOption] = (),
+    ) -> Model | None:
         """Retrieve a record by its ID.
 
         :Args:
         - `db_session` (Session): SQLModel database session. **(Required)**
         - `record_id` (UUID | int): ID of record. **(Required)**
+        - `options` (Sequence[ORMOption]): Loader options, e.g.
+        `joinedload(...)`, applied when record is fetched. **(Optional)**
 
         :Returns:
         - `Model | None`: Retrieved record, or None if not found.
 
         """
-        return db_session.get(entity=self.model, ident=record_id)
+        return db_session.get(
+            entity=self.model, ident=record_id, options=options
+        )
 
     def read_multiple_by_ids(
         self, db_session: Session, record_ids: list[int]
@@ -99,8 +119,34 @@ class BaseView(Generic[Model]):
         - `Sequence[Model]`: List of retrieved records.
 
         """
-        query: SelectOfScalar[Model] = select(self.model).where(
-            col(column_expression=self.model.id).in_(other=record_ids)
+        return db_session.exec(
+            statement=self.read_by_ids_query,
+            params={"record_ids": record_ids},
+        ).all()
+
+    def read_page(
+        self, db_session: Session, offset: int = 0, limit: int = 10
+    ) -> Sequence[Model]:
+        """Retrieve a window of records ordered by ID.
+
+        Description:
+        - Only `limit` rows starting at `offset` are fetched, so callers that
+        load records incrementally never materialize whole table.
+
+        :Args:
+        - `db_session` (Session): SQLModel database session. **(Required)**
+        - `offset` (int): Number of records to skip. **(Optional)**
+        - `limit` (int): Maximum number of records to fetch. **(Optional)**
+
+        :Returns:
+        - `Sequence[Model]`: List of records in requested window.
+
+        """
+        query: SelectOfScalar[Model] = (
+            select(self.model)
+            .order_by(self.model.id)  # type: ignore
+            .offset(offset=max(0, offset))
+            .limit(limit=max(0, limit))
         )
         return db_session.exec(statement=query).all()
 
@@ -135,7 +181,7 @@ class BaseView(Generic[Model]):
 
         """
         # Validate search column
-        if search_by and not hasattr(self.model, search_by):
+        if search_by and search_by not in self.search_columns:
             raise ValueError("Invalid search column")
 
         # Build search condition
@@ -173,32 +219,38 @@ class BaseView(Generic[Model]):
                 records=[],
             )
 
-        # Calculate cursor
-        cursor: int | None = (page - 1) * limit if page > 1 else None
-
-        # Build main query with all conditions
+        # Build main query with all conditions, fetching current page plus
+        # first record of next page
         query: SelectOfScalar[Model] = (
             select(self.model)
             .order_by(self.model.id)  # type: ignore
-            .limit(limit=limit)
+            .offset(offset=(page - 1) * limit)
+            .limit(limit=limit + 1)
         )
 
         if search_condition is not None:
             query = query.where(search_condition)
 
-        if cursor:
-            query = query.where(self.model.id > cursor)
-
         # Execute query
-        records: Sequence[Model] = db_session.exec(statement=query).all()
+        rows: Sequence[Model] = db_session.exec(statement=query).all()
+        records: Sequence[Model] = rows[:limit]
+
+        # Calculate cursors from neighbouring pages
+        next_cursor: int | None = rows[limit].id if len(rows) > limit else None
+        previous_cursor: int | None = None
+
+        if page > 1:
+            previous_query: SelectOfScalar[int] = (
+                select(self.model.id)
+                .order_by(self.model.id)  # type: ignore
+                .offset(offset=(page - 2) * limit)
+                .limit(limit=1)
+            )
 
-        # Calculate cursors
-        next_cursor: int | None = (
-            records[-1].id + 1 if page * limit < total_records else None
-        )
-        previous_cursor: int | None = (
-            max(1, ((page - 2) * limit) + 1) if page > 1 else None
-        )
+            if search_condition is not None:
+                previous_query = previous_query.where(search_condition)
+
+            previous_cursor = db_session.exec(statement=previous_query).first()
 
         return PaginationBase(
             current_page=page,
@@ -224,16 +276,23 @@ class BaseView(Generic[Model]):
         - `Model | None`: Updated record, or None if not found.
 
         """
-        db_record: Model | None = self.read_by_id(
-            db_session=db_session, record_id=record_id
+        values: dict[str, Any] = record.model_dump(exclude_unset=True)
+
+        if not values:
+            return self.read_by_id(db_session=db_session, record_id=record_id)
+
+        # Update and fetch record with a single UPDATE ... RETURNING
+        db_record: Model | None = (
+            db_session.execute(
+                statement=update(self.model)
+                .where(col(column_expression=self.model.id) == record_id)
+                .values(values)
+                .returning(self.model)
+            )
+            .scalars()
+            .one_or_none()
         )
-
-        if not db_record:
-            return None
-
-        db_record.sqlmodel_update(obj=record.model_dump(exclude_unset=True))
         db_session.commit()
-        db_session.refresh(instance=db_record)
 
         return db_record
 
@@ -319,3 +378,38 @@ class BaseView(Generic[Model]):
         db_session.commit()
 
         return Message(message="Records deleted successfully")
+
+
+class BulkCreateView(BaseView[Model]):
+    """Bulk Create View Class.
+
+    Description:
+    - This class extends base view with plain mapping inserts, for models
+    whose records need no per-record handling on creation.
+
+    """
+
+    def bulk_create(
+        self, db_session: Session, records: Sequence[dict[str, Any]]
+    ) -> Message:
+        """Insert many records from plain mappings in database.
+
+        Description:
+        - Rows are sent with a single executemany INSERT and no ORM objects
+        are built, so this suits imports where created records are not
+        needed back.
+
+        :Args:
+        - `db_session` (Session): SQLModel database session. **(Required)**
+        - `records` (Sequence[dict[str, Any]]): List of column-value
+        mappings to be inserted. **(Required)**
+
+        :Returns:
+        - `Message`: Message indicating that records have been created.
+
+        """
+        if records:
+            db_session.execute(statement=insert(self.model), params=records)
+            db_session.commit()
+
+        return Message(message="Records created successfully")
@@ -5,11 +5,11 @@ Description:
 
 """
 
-from ..base.view import BaseView
+from ..base.view import BulkCreateView
 from .model import Customer
 
 
-class CustomerView(BaseView[Customer]):
+class CustomerView(BulkCreateView[Customer]):
     """Customer View Class.
 
     Description:
@@ -5,18 +5,19 @@ Description:
 
 """
 
-from sqlmodel import Session
+from sqlalchemy import exists
+from sqlmodel import Session, col, select
 
 from workshop_management_system.v1.inventory_supplier_link.model import (
     InventorySupplierLink,
 )
 from workshop_management_system.v1.supplier.model import Supplier
 
-from ..base.view import BaseView
+from ..base.view import BulkCreateView
 from .model import Inventory
 
 
-class InventoryView(BaseView[Inventory]):
+class InventoryView(BulkCreateView[Inventory]):
     """Inventory View Class.
 
     Description:
@@ -46,30 +47,37 @@ class InventoryView(BaseView[Inventory]):
         - `Inventory | None`: Updated record, or None if not found.
 
         """
-        # Check if inventory record exists
-        db_record: Inventory | None = self.read_by_id(
-            db_session=db_session, record_id=record_id
-        )
-
-        if not db_record:
+        # Fetch inventory record and its previous supplier link together
+        row: tuple[Inventory, InventorySupplierLink] | None = db_session.exec(
+            statement=select(Inventory, InventorySupplierLink)
+            .join(
+                target=InventorySupplierLink,
+                onclause=col(
+                    column_expression=InventorySupplierLink.inventory_id
+                )
+                == Inventory.id,
+            )
+            .where(
+                Inventory.id == record_id,
+                InventorySupplierLink.supplier_id == previous_supplier_id,
+            )
+        ).first()
+
+        if not row:
             return None
 
-        # Check if previous supplier link exists
-        supplier_link: InventorySupplierLink | None = db_session.get(
-            entity=InventorySupplierLink,
-            ident=(record_id, previous_supplier_id),
-        )
-
-        if not supplier_link:
-            return None
+        db_record, supplier_link = row
 
-        # Check if new supplier exists
-        new_supplier: Supplier | None = db_session.get(
-            entity=Supplier,
-            ident=new_supplier_id,
-        )
+        # Check if new supplier exists, without loading supplier row
+        new_supplier_exists: bool = db_session.exec(
+            statement=select(
+                exists().where(
+                    col(column_expression=Supplier.id) == new_supplier_id
+                )
+            )
+        ).one()
 
-        if not new_supplier:
+        if not new_supplier_exists:
             return None
 
         # Update supplier link
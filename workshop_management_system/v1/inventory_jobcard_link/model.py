@@ -25,6 +25,9 @@ class InventoryJobCardLink(SQLModel, table=True):
         foreign_key="inventory.id", primary_key=True, ondelete="CASCADE"
     )
     jobcard_id: int = Field(
-        foreign_key="jobcard.id", primary_key=True, ondelete="CASCADE"
+        foreign_key="jobcard.id",
+        primary_key=True,
+        ondelete="CASCADE",
+        index=True,
     )
     quantity: int = Field(default=1, gt=0)
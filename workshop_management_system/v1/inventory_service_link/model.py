@@ -25,6 +25,9 @@ class InventoryServiceLink(SQLModel, table=True):
         foreign_key="inventory.id", primary_key=True, ondelete="CASCADE"
     )
     service_id: int = Field(
-        foreign_key="service.id", primary_key=True, ondelete="CASCADE"
+        foreign_key="service.id",
+        primary_key=True,
+        ondelete="CASCADE",
+        index=True,
     )
     quantity: int = Field(default=1, gt=0)
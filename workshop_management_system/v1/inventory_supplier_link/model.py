@@ -25,5 +25,8 @@ class InventorySupplierLink(SQLModel, table=True):
         foreign_key="inventory.id", primary_key=True, ondelete="CASCADE"
     )
     supplier_id: int = Field(
-        foreign_key="supplier.id", primary_key=True, ondelete="CASCADE"
+        foreign_key="supplier.id",
+        primary_key=True,
+        ondelete="CASCADE",
+        index=True,
     )
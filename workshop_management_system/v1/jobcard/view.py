@@ -7,7 +7,9 @@ Description:
 
 from collections.abc import Sequence
 
-from sqlmodel import Session, select
+from sqlalchemy import bindparam
+from sqlmodel import Session, col, select
+from sqlmodel.sql._expression_select_cls import SelectOfScalar
 
 from workshop_management_system.v1.inventory.model import Inventory
 from workshop_management_system.v1.inventory.view import InventoryView
@@ -18,6 +20,15 @@ from workshop_management_system.v1.inventory_jobcard_link.model import (
 from ..base.view import BaseView
 from .model import JobCard
 
+# Built once at import; only bound IDs change between calls
+LINKS_BY_JOBCARD_IDS: SelectOfScalar[InventoryJobCardLink] = select(
+    InventoryJobCardLink
+).where(
+    col(column_expression=InventoryJobCardLink.jobcard_id).in_(
+        other=bindparam(key="jobcard_ids", expanding=True)
+    )
+)
+
 
 class JobCardView(BaseView[JobCard]):
     """JobCard View Class.
@@ -70,15 +81,68 @@ class JobCardView(BaseView[JobCard]):
         validated Inventory objects.
 
         """
-        db_inventories: Sequence[Inventory] = (
-            self.inventory_view.read_multiple_by_ids(
-                db_session=db_session,
-                record_ids=list({inv.id for inv in inventories}),
+        # Lookup only reads inventories, so skip flushing pending records
+        with db_session.no_autoflush:
+            db_inventories: Sequence[Inventory] = (
+                self.inventory_view.read_multiple_by_ids(
+                    db_session=db_session,
+                    record_ids=list({inv.id for inv in inventories}),
+                )
             )
-        )
 
         return {inv.id: inv for inv in db_inventories}
 
+    def _get_existing_links(
+        self, db_session: Session, jobcard_ids: list[int]
+    ) -> dict[int, dict[int, InventoryJobCardLink]]:
+        """Get existing inventory links for job cards in a single query.
+
+        :Args:
+        - `db_session` (Session): SQLModel database session. **(Required)**
+        - `jobcard_ids` (list[int]): Job card IDs. **(Required)**
+
+        :Returns:
+        - `existing_links` (dict[int, dict[int, InventoryJobCardLink]]): Map of
+        job card IDs to their links keyed by inventory ID.
+
+        """
+        with db_session.no_autoflush:
+            links: Sequence[InventoryJobCardLink] = db_session.exec(
+                statement=LINKS_BY_JOBCARD_IDS,
+                params={"jobcard_ids": jobcard_ids},
+            ).all()
+
+        existing_links: dict[int, dict[int, InventoryJobCardLink]] = {
+            jobcard_id: {} for jobcard_id in jobcard_ids
+        }
+
+        for link in links:
+            existing_links[link.jobcard_id][link.inventory_id] = link
+
+        return existing_links
+
+    def _discard_link(
+        self, db_session: Session, link: InventoryJobCardLink
+    ) -> None:
+        """Remove an inventory link from session.
+
+        Description:
+        - Links added by an earlier record of same batch are still pending,
+        so they are expunged instead of deleted.
+
+        :Args:
+        - `db_session` (Session): SQLModel database session. **(Required)**
+        - `link` (InventoryJobCardLink): Link to remove. **(Required)**
+
+        :Returns:
+        - `None`
+
+        """
+        if link in db_session.new:
+            db_session.expunge(instance=link)
+        else:
+            db_session.delete(instance=link)
+
     def _process_inventory_links(
         self,
         db_session: Session,
@@ -106,6 +170,7 @@ class JobCardView(BaseView[JobCard]):
             existing_links = {}
 
         inventory_ids: set[int] = {inv.id for inv in inventories}
+        new_links: list[InventoryJobCardLink] = []
 
         # Process new/updated links
         for inventory in inventories:
@@ -141,16 +206,23 @@ class JobCardView(BaseView[JobCard]):
                     link.quantity = required_quantity
 
             else:
-                link = InventoryJobCardLink(
-                    jobcard_id=record_id,
-                    inventory_id=inventory.id,
-                    quantity=required_quantity,
+                new_links.append(
+                    InventoryJobCardLink(
+                        jobcard_id=record_id,
+                        inventory_id=inventory.id,
+                        quantity=required_quantity,
+                    )
                 )
-                db_session.add(instance=link)
+
+        # Add new links in one batch and track them for later passes
+        db_session.add_all(instances=new_links)
+        existing_links.update({link.inventory_id: link for link in new_links})
 
         # Remove old links
         for inv_id in set(existing_links.keys()) - inventory_ids:
-            db_session.delete(instance=existing_links[inv_id])
+            removed_link: InventoryJobCardLink = existing_links.pop(inv_id)
+
+            self._discard_link(db_session=db_session, link=removed_link)
 
     def create(self, db_session: Session, record: JobCard) -> JobCard:
         """Create a new jobcard in database.
@@ -213,15 +285,14 @@ class JobCardView(BaseView[JobCard]):
             db_session=db_session, inventories=all_inventories
         )
 
-        # Create all job cards
-        jobcards: list[JobCard] = []
-
-        for record in records:
-            # Create job card
-            jobcard = JobCard(**record.model_dump())
-            db_session.add(instance=jobcard)
-            db_session.flush()
+        # Create all job cards with a single flush
+        jobcards: list[JobCard] = [
+            JobCard(**record.model_dump()) for record in records
+        ]
+        db_session.add_all(instances=jobcards)
+        db_session.flush()
 
+        for jobcard, record in zip(jobcards, records, strict=True):
             # Process inventory links
             self._process_inventory_links(
                 db_session=db_session,
@@ -229,12 +300,14 @@ class JobCardView(BaseView[JobCard]):
                 inventories=record.inventories,
                 inventory_map=inventory_map,
             )
-            jobcards.append(jobcard)
 
+        jobcard_ids: list[int] = [jobcard.id for jobcard in jobcards]
         db_session.commit()
 
-        for jobcard in jobcards:
-            db_session.refresh(instance=jobcard)
+        # Reload created job cards in one query
+        self.read_multiple_by_ids(
+            db_session=db_session, record_ids=jobcard_ids
+        )
 
         return jobcards
 
@@ -270,15 +343,11 @@ class JobCardView(BaseView[JobCard]):
         )
 
         # Get existing links for job card
-        links: Sequence[InventoryJobCardLink] = db_session.exec(
-            statement=select(InventoryJobCardLink).where(
-                InventoryJobCardLink.jobcard_id == record_id
+        existing_links: dict[int, dict[int, InventoryJobCardLink]] = (
+            self._get_existing_links(
+                db_session=db_session, jobcard_ids=[record_id]
             )
-        ).all()
-
-        existing_links: dict[int, dict[int, InventoryJobCardLink]] = {
-            record_id: {link.inventory_id: link for link in links}
-        }
+        )
 
         # Update inventory links
         self._process_inventory_links(
@@ -317,14 +386,58 @@ class JobCardView(BaseView[JobCard]):
         if len(record_ids) != len(records):
             raise ValueError("Number of IDs must match number of records")
 
-        updated_records: list[JobCard] = []
+        # Get all existing job cards in one query
+        db_records: dict[int, JobCard] = {
+            db_record.id: db_record
+            for db_record in self.read_multiple_by_ids(
+                db_session=db_session, record_ids=record_ids
+            )
+        }
+
+        updates: list[tuple[JobCard, JobCard]] = [
+            (db_records[record_id], record)
+            for record_id, record in zip(record_ids, records, strict=True)
+            if record_id in db_records
+        ]
+
+        # Validate inventory presence for all records
+        all_inventories: list[Inventory] = []
+
+        for _, record in updates:
+            self._validate_inventories(record=record)
+            all_inventories.extend(record.inventories)
 
-        for record_id, record in zip(record_ids, records, strict=True):
-            updated_record: JobCard | None = self.update_by_id(
-                db_session=db_session, record_id=record_id, record=record
+        # Get inventory map and existing links for all job cards
+        inventory_map: dict[int, Inventory] = self._get_inventory_map(
+            db_session=db_session, inventories=all_inventories
+        )
+        existing_links: dict[int, dict[int, InventoryJobCardLink]] = (
+            self._get_existing_links(
+                db_session=db_session, jobcard_ids=list(db_records)
             )
+        )
 
-            if updated_record:
-                updated_records.append(updated_record)
+        for db_record, record in updates:
+            # Update inventory links
+            self._process_inventory_links(
+                db_session=db_session,
+                record_id=db_record.id,
+                inventories=record.inventories,
+                inventory_map=inventory_map,
+                existing_links=existing_links[db_record.id],
+            )
+
+            # Update job card
+            db_record.sqlmodel_update(
+                obj=record.model_dump(exclude_unset=True)
+            )
+
+        updated_ids: list[int] = [db_record.id for db_record, _ in updates]
+        db_session.commit()
+
+        # Reload updated records in one query
+        self.read_multiple_by_ids(
+            db_session=db_session, record_ids=updated_ids
+        )
 
-        return updated_records
+        return [db_record for db_record, _ in updates]
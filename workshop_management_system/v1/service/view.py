@@ -7,7 +7,9 @@ Description:
 
 from collections.abc import Sequence
 
-from sqlmodel import Session, select
+from sqlalchemy import ColumnElement, ScalarSelect, bindparam
+from sqlmodel import Session, col, func, select, update
+from sqlmodel.sql._expression_select_cls import SelectOfScalar
 
 from workshop_management_system.core.config import ServiceStatus
 from workshop_management_system.v1.base.model import Message
@@ -20,6 +22,15 @@ from workshop_management_system.v1.inventory_service_link.model import (
 from ..base.view import BaseView
 from .model import Service
 
+# Built once at import; only bound IDs change between calls
+LINKS_BY_SERVICE_IDS: SelectOfScalar[InventoryServiceLink] = select(
+    InventoryServiceLink
+).where(
+    col(column_expression=InventoryServiceLink.service_id).in_(
+        other=bindparam(key="service_ids", expanding=True)
+    )
+)
+
 
 class ServiceView(BaseView[Service]):
     """Service View Class.
@@ -59,13 +70,13 @@ class ServiceView(BaseView[Service]):
     def _get_inventory_map(
         self,
         db_session: Session,
-        inventories: list[Inventory],
+        inventory_ids: set[int],
     ) -> dict[int, Inventory]:
         """Get and validate inventory objects from database.
 
         :Args:
         - `db_session` (Session): SQLModel database session. **(Required)**
-        - `inventories` (list[Inventory]): List of inventories to validate.
+        - `inventory_ids` (set[int]): IDs of inventories to validate.
         **(Required)**
 
         :Returns:
@@ -73,36 +84,46 @@ class ServiceView(BaseView[Service]):
         validated Inventory objects.
 
         """
-        db_inventories: Sequence[Inventory] = (
-            self.inventory_view.read_multiple_by_ids(
-                db_session=db_session,
-                record_ids=list({inv.id for inv in inventories}),
+        # Lookup only reads inventories, so skip flushing pending records
+        with db_session.no_autoflush:
+            db_inventories: Sequence[Inventory] = (
+                self.inventory_view.read_multiple_by_ids(
+                    db_session=db_session,
+                    record_ids=list(inventory_ids),
+                )
             )
-        )
 
         return {inv.id: inv for inv in db_inventories}
 
     def _get_service_links(
-        self, db_session: Session, service_id: int
-    ) -> dict[int, InventoryServiceLink]:
-        """Get existing inventory-service links for a service.
+        self, db_session: Session, service_ids: list[int]
+    ) -> dict[int, dict[int, InventoryServiceLink]]:
+        """Get existing inventory-service links for services in one query.
 
         :Args:
         - `db_session` (Session): SQLModel database session. **(Required)**
-        - `service_id` (int): Service ID. **(Required)**
+        - `service_ids` (list[int]): Service IDs. **(Required)**
 
         :Returns:
-        - `inventory_service_links` (dict[int, InventoryServiceLink]): Map of
-        inventory IDs to link objects.
+        - `inventory_service_links` (dict[int, dict[int,
+        InventoryServiceLink]]): Map of service IDs to their links keyed by
+        inventory ID.
 
         """
-        links: Sequence[InventoryServiceLink] = db_session.exec(
-            statement=select(InventoryServiceLink).where(
-                InventoryServiceLink.service_id == service_id
-            )
-        ).all()
+        with db_session.no_autoflush:
+            links: Sequence[InventoryServiceLink] = db_session.exec(
+                statement=LINKS_BY_SERVICE_IDS,
+                params={"service_ids": service_ids},
+            ).all()
+
+        service_links: dict[int, dict[int, InventoryServiceLink]] = {
+            service_id: {} for service_id in service_ids
+        }
 
-        return {link.inventory_id: link for link in links}
+        for link in links:
+            service_links[link.service_id][link.inventory_id] = link
+
+        return service_links
 
     def _validate_inventory_quantities(
         self,
@@ -155,6 +176,28 @@ class ServiceView(BaseView[Service]):
 
         return required_quantities
 
+    def _discard_link(
+        self, db_session: Session, link: InventoryServiceLink
+    ) -> None:
+        """Remove an inventory link from session.
+
+        Description:
+        - Links added by an earlier record of same batch are still pending,
+        so they are expunged instead of deleted.
+
+        :Args:
+        - `db_session` (Session): SQLModel database session. **(Required)**
+        - `link` (InventoryServiceLink): Link to remove. **(Required)**
+
+        :Returns:
+        - `None`
+
+        """
+        if link in db_session.new:
+            db_session.expunge(instance=link)
+        else:
+            db_session.delete(instance=link)
+
     def _process_inventory_changes(
         self,
         db_session: Session,
@@ -182,16 +225,17 @@ class ServiceView(BaseView[Service]):
             existing_links = {}
 
         inventory_ids: set[int] = {inv.id for inv in inventories}
+        new_links: list[InventoryServiceLink] = []
 
         # First, restore quantities for removed inventories
         for inv_id in set(existing_links.keys()) - inventory_ids:
+            removed_link: InventoryServiceLink = existing_links.pop(inv_id)
             inv: Inventory | None = inventory_map.get(inv_id)
 
             if inv:
-                inv.quantity += existing_links[inv_id].quantity
-                db_session.add(instance=inv)
+                inv.quantity += removed_link.quantity
 
-            db_session.delete(instance=existing_links[inv_id])
+            self._discard_link(db_session=db_session, link=removed_link)
 
         # Validate inventories and get required quantities
         required_quantities: dict[int, int] = (
@@ -220,79 +264,70 @@ class ServiceView(BaseView[Service]):
                     # Update link quantity
                     link.quantity = new_quantity
 
-                    db_session.add(instance=link)
-
             else:
                 # Create new link
-                link = InventoryServiceLink(
-                    inventory_id=inventory.id,
-                    service_id=service_id,
-                    quantity=new_quantity,
+                new_links.append(
+                    InventoryServiceLink(
+                        inventory_id=inventory.id,
+                        service_id=service_id,
+                        quantity=new_quantity,
+                    )
                 )
-                db_session.add(instance=link)
 
                 # Subtract quantity from inventory
                 db_inventory.quantity -= new_quantity
 
-            db_session.add(instance=db_inventory)
+        # Add new links in one batch and track them for later passes
+        db_session.add_all(instances=new_links)
+        existing_links.update({link.inventory_id: link for link in new_links})
 
     def _restore_inventory_quantities(
-        self,
-        db_session: Session,
-        service_id: int,
-        exclude_completed: bool = False,
+        self, db_session: Session, service_ids: list[int]
     ) -> None:
-        """Restore inventory quantities for a service.
+        """Restore inventory quantities for services.
 
         :Args:
         - `db_session` (Session): SQLModel database session. **(Required)**
-        - `service_id` (int): Service ID. **(Required)**
-        - `exclude_completed` (bool): Whether to skip restoration for
-        completed services. **(Optional)**
+        - `service_ids` (list[int]): Service IDs. **(Required)**
 
         :Returns:
         - `None`
 
         """
-        # Check service status if needed
-        if exclude_completed:
-            service: Service | None = self.read_by_id(
-                db_session=db_session, record_id=service_id
-            )
-
-            if service and service.status == ServiceStatus.COMPLETED:
-                return
-
-        # Get service-inventory links
-        links: dict[int, InventoryServiceLink] = self._get_service_links(
-            db_session=db_session, service_id=service_id
-        )
-
-        if not links:
+        if not service_ids:
             return
 
-        # Get inventory objects
-        inventory_ids = list(links.keys())
-        inventories: Sequence[Inventory] = (
-            self.inventory_view.read_multiple_by_ids(
-                db_session=db_session, record_ids=inventory_ids
+        # Sum used quantities per inventory item in database
+        service_links: ColumnElement[bool] = col(
+            column_expression=InventoryServiceLink.service_id
+        ).in_(other=service_ids)
+        used_quantity: ScalarSelect[int] = (
+            select(func.sum(InventoryServiceLink.quantity))
+            .where(
+                service_links,
+                col(column_expression=InventoryServiceLink.inventory_id)
+                == Inventory.id,
             )
+            .scalar_subquery()
         )
-        inventory_map: dict[int, Inventory] = {
-            inv.id: inv for inv in inventories
-        }
-
-        # Restore quantities for each inventory item
-        for inv_id, link in links.items():
-            inventory: Inventory | None = inventory_map.get(inv_id)
-
-            if inventory:
-                inventory.quantity += link.quantity
-                db_session.add(instance=inventory)
 
-        # Delete links
-        for link in links.values():
-            db_session.delete(instance=link)
+        # Restore quantities for all inventory items with a single UPDATE;
+        # links themselves are removed along with their services
+        db_session.execute(
+            statement=update(Inventory)
+            .where(
+                col(column_expression=Inventory.id).in_(
+                    other=select(InventoryServiceLink.inventory_id).where(
+                        service_links
+                    )
+                )
+            )
+            .values(
+                quantity=col(column_expression=Inventory.quantity)
+                + used_quantity
+            )
+            .execution_options(synchronize_session="fetch")
+        )
 
     def create(self, db_session: Session, record: Service) -> Service:
         """Create a new service in database.
@@ -308,7 +343,8 @@ class ServiceView(BaseView[Service]):
         """
         self._validate_inventories(record=record)
         inventory_map: dict[int, Inventory] = self._get_inventory_map(
-            db_session=db_session, inventories=record.inventories
+            db_session=db_session,
+            inventory_ids={inv.id for inv in record.inventories},
         )
 
         # Create new service
@@ -351,29 +387,32 @@ class ServiceView(BaseView[Service]):
 
         # Get inventory map for all inventories
         inventory_map: dict[int, Inventory] = self._get_inventory_map(
-            db_session=db_session, inventories=all_inventories
+            db_session=db_session,
+            inventory_ids={inv.id for inv in all_inventories},
         )
 
-        # Create all services
-        services: list[Service] = []
-
-        for record in records:
-            service = Service(**record.model_dump())
-            db_session.add(instance=service)
-            db_session.flush()
+        # Create all services with a single flush
+        services: list[Service] = [
+            Service(**record.model_dump()) for record in records
+        ]
+        db_session.add_all(instances=services)
+        db_session.flush()
 
+        for service, record in zip(services, records, strict=True):
             self._process_inventory_changes(
                 db_session=db_session,
                 service_id=service.id,
                 inventories=record.inventories,
                 inventory_map=inventory_map,
             )
-            services.append(service)
 
+        service_ids: list[int] = [service.id for service in services]
         db_session.commit()
 
-        for service in services:
-            db_session.refresh(instance=service)
+        # Reload created services in one query
+        self.read_multiple_by_ids(
+            db_session=db_session, record_ids=service_ids
+        )
 
         return services
 
@@ -406,8 +445,8 @@ class ServiceView(BaseView[Service]):
         # Get existing links for service
         existing_links: dict[int, InventoryServiceLink] = (
             self._get_service_links(
-                db_session=db_session, service_id=record_id
-            )
+                db_session=db_session, service_ids=[record_id]
+            )[record_id]
         )
 
         # Get all inventory IDs needed (existing and new)
@@ -417,11 +456,7 @@ class ServiceView(BaseView[Service]):
 
         # Get inventory map for all inventories
         inventory_map: dict[int, Inventory] = self._get_inventory_map(
-            db_session=db_session,
-            inventories=[
-                Inventory(id=inv_id)  # type: ignore
-                for inv_id in all_inventory_ids
-            ],
+            db_session=db_session, inventory_ids=all_inventory_ids
         )
 
         # Process inventory links
@@ -461,19 +496,65 @@ class ServiceView(BaseView[Service]):
         if len(record_ids) != len(records):
             raise ValueError("Number of IDs must match number of records")
 
-        updated_records: list[Service] = []
+        # Get all existing services in one query
+        db_records: dict[int, Service] = {
+            db_record.id: db_record
+            for db_record in self.read_multiple_by_ids(
+                db_session=db_session, record_ids=record_ids
+            )
+        }
+
+        updates: list[tuple[Service, Service]] = [
+            (db_records[record_id], record)
+            for record_id, record in zip(record_ids, records, strict=True)
+            if record_id in db_records
+        ]
 
-        for record_id, record in zip(record_ids, records, strict=True):
-            updated_record: Service | None = self.update_by_id(
+        # Validate inventory presence for all records
+        for _, record in updates:
+            self._validate_inventories(record=record)
+
+        # Get existing links for all services
+        existing_links: dict[int, dict[int, InventoryServiceLink]] = (
+            self._get_service_links(
+                db_session=db_session, service_ids=list(db_records)
+            )
+        )
+
+        # Get all inventory IDs needed (existing and new)
+        all_inventory_ids: set[int] = {
+            inv_id for links in existing_links.values() for inv_id in links
+        } | {inv.id for _, record in updates for inv in record.inventories}
+
+        # Get inventory map for all inventories
+        inventory_map: dict[int, Inventory] = self._get_inventory_map(
+            db_session=db_session, inventory_ids=all_inventory_ids
+        )
+
+        for db_record, record in updates:
+            # Process inventory links
+            self._process_inventory_changes(
                 db_session=db_session,
-                record_id=record_id,
-                record=record,
+                service_id=db_record.id,
+                inventories=record.inventories,
+                inventory_map=inventory_map,
+                existing_links=existing_links[db_record.id],
             )
 
-            if updated_record:
-                updated_records.append(updated_record)
+            # Update service record
+            db_record.sqlmodel_update(
+                obj=record.model_dump(exclude_unset=True)
+            )
+
+        updated_ids: list[int] = [db_record.id for db_record, _ in updates]
+        db_session.commit()
+
+        # Reload updated records in one query
+        self.read_multiple_by_ids(
+            db_session=db_session, record_ids=updated_ids
+        )
 
-        return updated_records
+        return [db_record for db_record, _ in updates]
 
     def delete_by_id(
         self, db_session: Session, record_id: int
@@ -498,9 +579,10 @@ class ServiceView(BaseView[Service]):
             return None
 
         # Restore inventory quantities if not completed
-        self._restore_inventory_quantities(
-            db_session=db_session, service_id=record_id, exclude_completed=True
-        )
+        if record.status != ServiceStatus.COMPLETED:
+            self._restore_inventory_quantities(
+                db_session=db_session, service_ids=[record_id]
+            )
 
         # Delete service
         db_session.delete(instance=record)
@@ -530,9 +612,20 @@ class ServiceView(BaseView[Service]):
         if not services:
             return Message(message="No services found to delete")
 
-        # Process each service
+        # Restore inventory quantities for services not completed
+        self._restore_inventory_quantities(
+            db_session=db_session,
+            service_ids=[
+                service.id
+                for service in services
+                if service.status != ServiceStatus.COMPLETED
+            ],
+        )
+
+        # Delete services in one transaction
         for service in services:
-            # Delete by ID to handle inventory restoration
-            self.delete_by_id(db_session=db_session, record_id=service.id)
+            db_session.delete(instance=service)
+
+        db_session.commit()
 
         return Message(message="Records deleted successfully")
@@ -5,11 +5,11 @@ Description:
 
 """
 
-from ..base.view import BaseView
+from ..base.view import BulkCreateView
 from .model import Supplier
 
 
-class SupplierView(BaseView[Supplier]):
+class SupplierView(BulkCreateView[Supplier]):
     """Supplier View Class.
 
     Description:
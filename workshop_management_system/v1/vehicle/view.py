@@ -5,11 +5,11 @@ Description:
 
 """
 
-from ..base.view import BaseView
+from ..base.view import BulkCreateView
 from .model import Vehicle
 
 
-class VehicleView(BaseView[Vehicle]):
+class VehicleView(BulkCreateView[Vehicle]):
     """Vehicle View Class.
 
     Description: